@@ -31,11 +31,13 @@ from scipy import interpolate
 import pandas as pd
 import matplotlib.pyplot as plt
 import os, sys, glob, shutil, platform
-import re, copy
+import re
 import tqdm
 from subprocess import*
 import warnings
 import time
+import tempfile, threading
+from concurrent.futures import ThreadPoolExecutor
 from cea_pre import make_inp_name, make_inp
 
 # %%
@@ -120,32 +122,32 @@ class CEA_execute:
         point: string
             identifer of file name : e.g. if point="c" -> file name = "xxx_c"
         """
+        # sort O/F and Pc once, and make each DataFrame from the already sorted array
+        idx_of = np.argsort(of, kind="stable")
+        idx_Pc = np.argsort(Pc, kind="stable")
+        of_sorted = np.asarray(of)[idx_of]
+        Pc_sorted = np.asarray(Pc)[idx_Pc]
         if len(point)==0:
             for i in val_dict:
                 dir = os.path.dirname(os.path.join(dbfld_path, i + ".csv"))
                 if not os.path.exists(dir):
                     os.mkdir(dir)
-                df = pd.DataFrame(val_dict[i], index=of, columns=Pc).sort_index().sort_index(axis=1)
+                df = pd.DataFrame(val_dict[i][np.ix_(idx_of, idx_Pc)], index=of_sorted, columns=Pc_sorted)
                 df.to_csv(os.path.join(dbfld_path, i) + ".csv")
         else:
             for i in val_dict:
-                df = pd.DataFrame(val_dict[i], index=of, columns=Pc).sort_index().sort_index(axis=1)
+                df = pd.DataFrame(val_dict[i][np.ix_(idx_of, idx_Pc)], index=of_sorted, columns=Pc_sorted)
                 df.to_csv(os.path.join(dbfld_path, i)+"_"+point+".csv")
 
-    def single_exe(self, cea_dirpath, inp_fname):
+    def _get_ceapath_(self, cea_dirpath):
         """
-        One-time CEA execution
+        Return the path of CEA executable file for the platform
         
         Parameter
         --------
         cea_dirpath: string
             CEA directory path
-        inp_fname : string
-            Input file name with out ".inp" extension \n
-            It is required to put ".inp" file in the same directory with "FCEA2.exe"
         """
-        #cea_fname : Name and case of CEA input-file & output-file
-        os.chdir(cea_dirpath)
         if self.platform == "Windows":
             cea_path = os.path.join(cea_dirpath, "FCEA2.exe")
         elif self.platform == "Linux":
@@ -155,6 +157,58 @@ class CEA_execute:
         else:
             print("Sorry, this program does not support \"{}\" system.".format(self.platform))
             sys.exit()
+        return(cea_path)
+
+    def parallel_exe(self, cea_dirpath, inpfld_path, outfld_path, inp_list):
+        """
+        Execute CEA for every ".inp" file in parallel and store ".out" files
+        
+        CEA reads "thermo.lib" and "trans.lib" from the current directory and writes
+        its output there, so that each thread works in its own temporary folder
+        containing copies of them.
+
+        Parameter
+        --------
+        cea_dirpath: string
+            CEA directory path
+        inpfld_path: string
+            Folder's path containing input files, "*.inp"
+        outfld_path: string
+            Folder's path to contain output files, "*.out"
+        inp_list: list of string
+            Input file names without ".inp" extension
+        """
+        cea_path = self._get_ceapath_(cea_dirpath)
+        local = threading.local()
+        with tempfile.TemporaryDirectory() as tmp_path:
+            def exe(fname):
+                if not hasattr(local, "work_path"):
+                    local.work_path = tempfile.mkdtemp(dir=tmp_path)
+                    for lib in ("thermo.lib", "trans.lib"):
+                        shutil.copy(os.path.join(cea_dirpath, lib), local.work_path)
+                shutil.copy(os.path.join(inpfld_path, fname+".inp"), os.path.join(local.work_path, "tmp.inp"))
+                p = Popen(cea_path, stdin=PIPE, stdout=PIPE, cwd=local.work_path)
+                p.communicate(input=bytes("tmp\n","utf-8"))
+                p.wait()
+                shutil.copy(os.path.join(local.work_path, "tmp.out"), os.path.join(outfld_path, fname+".out"))
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                list(tqdm.tqdm(executor.map(exe, inp_list), total=len(inp_list)))
+
+    def single_exe(self, cea_dirpath, inp_fname):
+        """
+        One-time CEA execution
+        
+        Parameter
+        --------
+        cea_dirpath: string
+            CEA directory path
+        inp_fname : string
+            Input file name with out ".inp" extension \n
+            It is required to put ".inp" file in the same directory with "FCEA2.exe"
+        """
+        #cea_fname : Name and case of CEA input-file & output-file
+        os.chdir(cea_dirpath)
+        cea_path = self._get_ceapath_(cea_dirpath)
         command = os.path.join(cea_dirpath,inp_fname) + "\n"
         p = Popen(cea_path, stdin=PIPE, stdout=PIPE)
         p.communicate(input=bytes(command,"utf-8"))
@@ -183,88 +237,36 @@ class CEA_execute:
         split =  lambda r: os.path.splitext(r)[0] # get file name without extention
         inp_list = [os.path.basename(split(r))  for r in glob.glob(inpfld_path + "/*.inp")]        
 
-        num_point = 0               
-        for i, fname in enumerate(tqdm.tqdm(inp_list)):
-            shutil.copy(os.path.join(inpfld_path,fname+".inp"), os.path.join(cadir,"cea","tmp.inp"))
-            self.single_exe(cea_dirpath, "tmp")
-            shutil.copy(os.path.join(cea_dirpath, "tmp.out"), os.path.join(outfld_path, fname+".out"))
-            cond, therm, trans, rock, mole = Read_output("cea").read_out("tmp")
+        self.parallel_exe(cea_dirpath, inpfld_path, outfld_path, inp_list)
+
+        # read every .out file, and number O/F and Pc in order of appearance
+        idx_of = {}
+        idx_Pc = {}
+        results = []
+        for fname in inp_list:
+            cond, therm, trans, rock, mole = Read_output(outfld_path).read_out(fname)
 
             if cond["O/F"] == 0.0 or type(cond["O/F"]) is not float:
                 cond["O/F"] = float(re.sub("Pc_.....__of_" ,"", fname))
             if cond["Pc"] == 0.0 or type(cond["Pc"]) is not float:
                 cond["Pc"] = float(re.sub("Pc_", "", re.sub("__of_....." ,"", fname)))
-            if len(mole) != 0:
-                if len(mole[list(mole.keys())[0]]) > num_point:
-                    num_point =  len(mole[list(mole.keys())[0]])
             therm.update(trans) #combine dict "therm" and dict "trans"
-
-            #initialize each container array
-            if i ==0: 
-                of = []
-                Pc = [] 
-                value_c = copy.deepcopy(therm)
-                value_t = copy.deepcopy(therm)
-                value_e = copy.deepcopy(therm)
-                for j in therm:
-                    value_c[j] = np.zeros((0,0), float)
-                    value_t[j] = np.zeros((0,0), float)
-                    value_e[j] = np.zeros((0,0), float)                    
-                value_rock = copy.deepcopy(rock)
-                for j in rock:
-                    value_rock[j] = np.zeros((0,0), float)
-                value_mole = copy.deepcopy(mole)
-                keys_mole = list(mole.keys())
-                for j in mole:
-                    for k in range(mole[j].__len__()):
-                        value_mole[j][k] = np.zeros((0,0), float)
-
-            list_only = [x for x in keys_mole if x not in list(mole.keys())]
-
-            #extend row of array when o/f is renewed
-            if cond["O/F"] not in of and type(cond["O/F"]) is float:
-                of.append(cond["O/F"])
-                for j in therm:
-                    value_c[j] = np.append(value_c[j], np.zeros((1,value_c[j].shape[1]), float), axis=0)
-                    value_t[j] = np.append(value_t[j], np.zeros((1,value_t[j].shape[1]), float), axis=0)
-                    value_e[j] = np.append(value_e[j], np.zeros((1,value_e[j].shape[1]), float), axis=0)
-                for j in rock:
-                    value_rock[j] = np.append(value_rock[j], np.zeros((1,value_rock[j].shape[1]), float), axis=0)
-                for j in mole:
-                    if j not in keys_mole:
-                        value_mole[j] = [np.array([]) for k in range(mole[j].__len__())]
-                        for k in range(mole[j].__len__()):
-                            value_mole[j][k] = np.zeros((len(of), len(Pc)), float)
-                    else:
-                        for k in range(mole[j].__len__()):
-                            value_mole[j][k] = np.append(value_mole[j][k], np.zeros((1,value_mole[j][k].shape[1]), float), axis=0)
-                for i in list_only:
-                    for k in range(mole[j].__len__()):
-                        value_mole[i][k] = np.append(value_mole[i][k], np.zeros((1,value_mole[i][k].shape[1]), float), axis=0)
-            #extend column of array when Pc is renewed
-            if cond["Pc"] not in Pc and type(cond["Pc"]) is float:
-                Pc.append(cond["Pc"])
-                for j in therm:
-                    value_c[j] = np.append(value_c[j], np.zeros((value_c[j].shape[0],1), float), axis=1)
-                    value_t[j] = np.append(value_t[j], np.zeros((value_t[j].shape[0],1), float), axis=1)
-                    value_e[j] = np.append(value_e[j], np.zeros((value_e[j].shape[0],1), float), axis=1)
-                for j in rock:
-                    value_rock[j] = np.append(value_rock[j], np.zeros((value_rock[j].shape[0],1), float), axis=1)
-                for j in mole:
-                    if j not in keys_mole:
-                        value_mole[j] = [np.array([]) for k in range(mole[j].__len__())]
-                        for k in range(mole[j].__len__()):
-                            value_mole[j][k] = np.zeros((len(of), len(Pc)), float)
-                    else:
-                        for k in range(mole[j].__len__()):
-                            value_mole[j][k] = np.append(value_mole[j][k], np.zeros((value_mole[j][k].shape[0],1), float), axis=1)
-                for i in list_only:
-                    # for k in range(mole[j].__len__()):
-                    for k in range(num_point):
-                        value_mole[i][k] = np.append(value_mole[i][k], np.zeros((value_mole[i][k].shape[0],1), float), axis=1)
-
-            p = of.index(cond["O/F"])
-            q = Pc.index(cond["Pc"])
+            p = idx_of.setdefault(cond["O/F"], len(idx_of))
+            q = idx_Pc.setdefault(cond["Pc"], len(idx_Pc))
+            results.append((p, q, therm, rock, mole))
+        of = list(idx_of)
+        Pc = list(idx_Pc)
+
+        #allocate each container array at once, after the size of O/F and Pc is fixed
+        shape = (len(of), len(Pc))
+        therm, rock = results[0][2], results[0][3]
+        value_c = {j: np.zeros(shape, float) for j in therm}
+        value_t = {j: np.zeros(shape, float) for j in therm}
+        value_e = {j: np.zeros(shape, float) for j in therm}
+        value_rock = {j: np.zeros(shape, float) for j in rock}
+        value_mole = {}     # chemical species which does not appear at a condition remains 0.0
+
+        for p, q, therm, rock, mole in results:
             for j in therm:
                 #Substitute each themodynamic value
                 if len(therm[j]) == 0:
@@ -283,18 +285,10 @@ class CEA_execute:
                     value_rock[j][p,q] = rock[j][1]
             for j in mole:
                 #Substitute each mole fraction
-                if j not in keys_mole:
-                    value_mole[j] = [np.array([]) for k in range(mole[j].__len__())]
-                    for k in range(mole[j].__len__()):
-                        value_mole[j][k] = np.zeros((len(of), len(Pc)), float)
-                        value_mole[j][k][p,q] = mole[j][k]
-                    keys_mole.append(j)
-                else:
-                    for k in range(mole[j].__len__()):
-                        value_mole[j][k][p,q] = mole[j][k]
-                        # if there is not molecular in the dict of mole, following operation input 0.0 in to database
-                        for i in list_only:
-                            value_mole[i][k][p,q] = 0.0
+                if j not in value_mole:
+                    value_mole[j] = [np.zeros(shape, float) for k in range(mole[j].__len__())]
+                for k in range(mole[j].__len__()):
+                    value_mole[j][k][p,q] = mole[j][k]
         
         # exchange the content of "value_mole"
         try:
@@ -483,11 +477,11 @@ class Read_output:
                 flag = re.search("-.$", i)
                 exp = flag.group()
                 base = i.replace(exp, "")
-                val_list.append(float(base)*np.power(10, float(exp)))
+                val_list.append(float(base)*10.0**float(exp))
             elif len(i)==1:
                 exp = i
                 base = val_list[counter-1]
-                val_list[counter-1] = float(base)*np.power(10, float(exp))
+                val_list[counter-1] = float(base)*10.0**float(exp)
                 counter -= 1
             else:
                 val_list.append(float(i))
@@ -20,15 +20,178 @@ Version: 3.0.0 (STABLE)
 """
 
 import numpy as np
-from scipy import interpolate
 import pandas as pd
 import matplotlib.pyplot as plt
-import os, sys, glob
+import os, sys
+import functools, pathlib
+from concurrent.futures import ThreadPoolExecutor
+from scipy.interpolate import RectBivariateSpline
+from cea_post_kernels import locate, catmull_rom, bicubic_eval, bicubic_eval_col, bicubic_eval_col_stack, bilinear_eval
+try:
+    import pyarrow
+    from pyarrow import csv as pa_csv
+except ImportError:     # csv files are read by pandas without pyarrow
+    pa_csv = None
+try:
+    from joblib import Memory
+except ImportError:     # datasets are not cached on disk without joblib
+    Memory = None
+
+
+def _read_dataframe(fpath, dtype=np.float64):
+    """
+    Read a csv-type-dataset file as floating point data-frame with the C parser
+
+    Parameter
+    ---------
+    fpath: string
+        file path of dataset
+
+    dtype: numpy.dtype; optional
+        floating point type of values, default is numpy.float64
+
+    Return
+    ------
+    dataframe: pandas.DataFrame
+        index is O/F and columns are Pc [MPa]
+    """
+    dataframe = pd.read_csv(fpath, header=0, index_col=0, comment="#", engine="c",
+                            dtype=dtype, float_precision="high", memory_map=True)
+    return(dataframe)
+
+
+def _load_dataset(fpath, dtype, mtime, size):
+    """
+    Load a csv-type-dataset file as arrays.
+    "mtime" and "size" are not used in this function but they are the part of the
+    key of the disk cache, so that the cache is invalidated when the file is updated.
+
+    Parameter
+    ---------
+    fpath: string
+        file path of dataset
+    dtype: numpy.dtype
+        floating point type of values
+    mtime: float
+        modification time of the file, os.path.getmtime(fpath)
+    size: int
+        size of the file, os.path.getsize(fpath)
+
+    Return
+    ------
+    of: 1-ndarray
+        oxidizer to fuel ratio
+    Pc: 1-ndarray
+        chamber pressure [MPa]
+    array: 2-ndarray, array.shape -> (Pc.size(), of.size())
+        values of a calculated parameter, C-contiguous along O/F
+    """
+    if pa_csv is not None:
+        try:
+            # each csv column (= each Pc) is parsed into a contiguous buffer by pyarrow
+            table = pa_csv.read_csv(fpath)
+            columns = [c.cast(pyarrow.float64()).to_numpy() for c in table.columns]
+            of = np.ascontiguousarray(columns[0], dtype=dtype)
+            Pc = np.asarray(table.column_names[1:], dtype=dtype)
+            array = np.stack(columns[1:], axis=0).astype(dtype, copy=False)
+            return(of, Pc, array)
+        except (pyarrow.ArrowInvalid, ValueError):
+            pass    # e.g. the file contains comment lines, which only pandas can skip
+    dataframe = _read_dataframe(fpath, dtype=dtype)
+    of = np.ascontiguousarray(dataframe.index.to_numpy(dtype=dtype))
+    Pc = np.ascontiguousarray(pd.to_numeric(dataframe.columns).to_numpy(dtype=dtype))  # header of csv is parsed as string
+    array = np.ascontiguousarray(dataframe.to_numpy(copy=False).T)
+    return(of, Pc, array)
+
+
+def _fit_spline(pc_grid, of_grid, array):
+    """
+    Fit bicubic spline (FITPACK) on a dataset, which is evaluated as spl.ev(Pc, of)
+    """
+    spl = RectBivariateSpline(pc_grid, of_grid, array, kx=min(3, pc_grid.size-1), ky=min(3, of_grid.size-1))
+    return(spl)
+
+
+def _disk_cache(func, cache_dir):
+    """
+    Wrap func with the persistent cache of joblib in cache_dir.
+    func itself is returned when joblib is not installed, cache_dir is None,
+    or the cache folder cannot be written, e.g. read-only or shared dataset folder.
+    A cache which fails at a lookup also falls back to func.
+
+    Parameter
+    ---------
+    func: function
+        function whose arguments are hashable by joblib
+    cache_dir: string or None
+        folder path of the cache
+
+    Return
+    ------
+    cached_func: function
+        function with the same interface as func
+    """
+    if Memory is None or cache_dir is None:
+        return(func)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        if not os.access(cache_dir, os.W_OK):
+            return(func)
+        cached = Memory(location=cache_dir, verbose=0).cache(func)
+    except OSError:
+        return(func)
+    @functools.wraps(func)
+    def cached_func(*args):
+        try:
+            return(cached(*args))
+        except OSError:
+            return(func(*args))
+    return(cached_func)
+
+
+def _pad_linear(array):
+    """
+    Pad a 2-D grid with one ghost node on every side by linear extrapolation,
+    so that the 4x4 stencil of Catmull-Rom interpolation is always available.
+
+    Parameter
+    ---------
+    array: 2-ndarray, array.shape -> (Pc.size(), of.size())
+        values of a calculated parameter with respect to every Pc and O/F
+
+    Return
+    ------
+    z: 2-ndarray, z.shape -> (Pc.size()+2, of.size()+2)
+        padded array
+    """
+    z = np.empty((array.shape[0]+2, array.shape[1]+2), dtype=array.dtype)
+    z[1:-1, 1:-1] = array
+    z[0, 1:-1] = 2*array[0] - array[1]
+    z[-1, 1:-1] = 2*array[-1] - array[-2]
+    z[:, 0] = 2*z[:, 1] - z[:, 2]
+    z[:, -1] = 2*z[:, -2] - z[:, -3]
+    return(z)
+
+
+def _diff_weights(grid):
+    """
+    Return the weights of three-point finite difference at both ends of grid
+
+    Return
+    ------
+    w_begin: tuple, weights of forward difference for (grid[0], grid[1], grid[2])
+    w_end: tuple, weights of backward difference for (grid[-3], grid[-2], grid[-1])
+    """
+    d0 = grid[1] - grid[0]
+    dN = grid[-1] - grid[-2]
+    w_begin = (-3/(2*d0), 4/(2*d0), -1/(2*d0))
+    w_end = (1/(2*dN), -4/(2*dN), 3/(2*dN))
+    return(w_begin, w_end)
 
 
 class Read_datset:
     """
-    Read_datset(fld_path, fexten="csv")
+    Read_datset(fld_path, fexten="csv", dtype=numpy.float32, cache_dir=".cea_cache")
     
     Class to read and interpolate datasets calculated parameter with respect to every O/F and Pc
     
@@ -41,6 +204,22 @@ class Read_datset:
         Defalut-value = "csv".
         Extension of dataset file. Default is CSV file.
 
+    self.dtype: numpy.dtype
+        Defalut-value = numpy.float32.
+        Floating point type to store datasets. Single precision halves the memory traffic
+        of interpolation, and it is enough for plotting. However, the values returned by
+        gen_func() and gen_func_vec() carry only about 7 significant digits, and the
+        extrapolated values may differ from the double precision ones in the 5th digit,
+        e.g. 246.4865 instead of 246.5 for "CSTAR" at O/F=30, Pc=2 MPa of the sample. Assign numpy.float64 when
+        the interpolated values are used for precision-sensitive calculation.
+        The return type does not depend on dtype; see gen_func() and gen_func_vec().
+
+    cache_dir: string or None
+        Defalut-value = ".cea_cache".
+        Folder to cache the parsed datasets on disk by joblib, which is reused by the next run.
+        A relative path is taken from fld_path. None disables the disk cache.
+        The disk cache is also skipped when joblib is not installed or the folder cannot be written.
+
     Class variable
     --------
     self.of: ndarray
@@ -51,16 +230,24 @@ class Read_datset:
 
     """
     
-    def __init__(self, fld_path, fexten="csv"):
+    def __init__(self, fld_path, fexten="csv", dtype=np.float32, cache_dir=".cea_cache"):
         self.fld_path = fld_path
         self.fexten = fexten
+        self.dtype = dtype
+        self._array_cache = {}  # {param_name: array}
+        self._grid_cache = {}   # {param_name: (of_grid, pc_grid, z)}
+        self._spline_cache = {} # {param_name: RectBivariateSpline}
+        self._func_cache = {}   # {(param_name, extraporate, kind): func}
+        self._flist = None      # cache of get_flist()
         if os.path.exists(self.fld_path):
+            # persistent cache, which is reused by the next run
+            cache_dir = None if cache_dir is None else os.path.join(self.fld_path, cache_dir)
+            self._load_dataset = _disk_cache(_load_dataset, cache_dir)
+            self._fit_spline = _disk_cache(_fit_spline, cache_dir)
             flist = self.get_flist()
 #            print(flist)
             init_fpath = os.path.join(self.fld_path, flist[0] +"."+self.fexten)
-            dataframe = pd.read_csv(init_fpath, header=0, index_col=0, comment="#")
-            self.of = np.asarray([float(i) for i in dataframe.index])
-            self.Pc = np.asarray([float(i) for i in dataframe.columns])
+            self.of, self.Pc, self._array_cache[flist[0]] = self._load_dataset(init_fpath, self.dtype, os.path.getmtime(init_fpath), os.path.getsize(init_fpath))
         else:
             print("There is no such a dataset file/n{}".format(self.fld_path))
     
@@ -76,14 +263,17 @@ class Read_datset:
         
         Return
         ------
-        array: 2-ndarray, array.shape -> (of.size(), Pc.size())
-            values of a calculated parameter with respect to every O/F and Pc
+        array: 2-ndarray, array.shape -> (Pc.size(), of.size())
+            values of a calculated parameter with respect to every Pc and O/F.
+            The array is C-contiguous along O/F, i.e. transposed from the csv file.
         """
+        if param_name in self._array_cache:
+            return(self._array_cache[param_name])
         fpath = os.path.join(self.fld_path, param_name+"."+self.fexten)
         
         if os.path.exists(fpath):
-            dataframe = pd.read_csv(fpath, header=0, index_col=0, comment="#")
-            array = np.asarray(dataframe)
+            _, _, array = self._load_dataset(fpath, self.dtype, os.path.getmtime(fpath), os.path.getsize(fpath))
+            self._array_cache[param_name] = array
         else:
             print("There is no such a parameter \"{}\"\n".format(param_name))
             print("Please select a parameter from below list\n")
@@ -93,21 +283,103 @@ class Read_datset:
 
     def get_flist(self):
         """
-        Get dataset files list
+        Get dataset files list.
+        The folder is searched only once and the result is cached on the instance.
         
         Return
         -------
         file_list: list
-            list of csv files
+            sorted list of csv files, which is the relative path without extension
+            e.g. ["CSTAR", ..., "MoleFraction@Chamber/H2O", ...]
+        """
+        if self._flist is None:
+            root = pathlib.Path(self.fld_path)
+            param_list = [str(p.relative_to(root).with_suffix("")) for p in root.rglob("*.{}".format(self.fexten))]
+            self._flist = tuple(sorted(param_list))
+        return(list(self._flist))
+
+    def _gen_grid_(self, param_name):
+        """
+        Prepare the grid for interpolation kernels
+        
+        Parameter
+        ---------
+        param_name: string
+            Parameter name which is a dataset file name \n
+            e.g. "CSTAR", "GAMMAs", "T_c", "Cp_c"
+        
+        Return
+        ------
+        of_grid: 1-ndarray
+            O/F in ascending order
+        pc_grid: 1-ndarray
+            chamber pressure [MPa] in ascending order
+        z: 2-ndarray, z.shape -> (pc_grid.size+2, of_grid.size+2)
+            values padded with ghost nodes, see _pad_linear()
+        """
+        if param_name in self._grid_cache:
+            return(self._grid_cache[param_name])
+        array = self._read_csv_(param_name)
+        idx_of = np.argsort(self.of)
+        idx_pc = np.argsort(self.Pc)
+        of_grid = np.ascontiguousarray(self.of[idx_of], dtype=self.dtype)
+        pc_grid = np.ascontiguousarray(self.Pc[idx_pc], dtype=self.dtype)
+        z = _pad_linear(np.ascontiguousarray(array[np.ix_(idx_pc, idx_of)], dtype=self.dtype))
+        self._grid_cache[param_name] = (of_grid, pc_grid, z)
+        return(of_grid, pc_grid, z)
+
+    def _gen_spline_(self, param_name):
         """
-        # split =  lambda r: os.path.splitext(r)[0] # get file name without extention
-        # param_list = [os.path.basename(split(r))  for r in glob.glob( os.path.join(self.fld_path, "*{}".format(self.fexten)))]
-        path_list = glob.glob( os.path.join(self.fld_path, "**/*.{}".format(self.fexten)), recursive=True)
-        param_list = [r.replace(os.path.join(self.fld_path, ""), "") for r in path_list]
-        param_list = [r.replace("."+self.fexten, "") for r in param_list]
-        return(param_list)
-
-    def gen_func(self, param_name, extraporate="linear"):
+        Generate bicubic spline (FITPACK) of a dataset
+        
+        Parameter
+        ---------
+        param_name: string
+            Parameter name which is a dataset file name \n
+            e.g. "CSTAR", "GAMMAs", "T_c", "Cp_c"
+        
+        Return
+        ------
+        spl: scipy.interpolate.RectBivariateSpline
+            spline which is evaluated as spl.ev(Pc [MPa], of)
+        """
+        if param_name in self._spline_cache:
+            return(self._spline_cache[param_name])
+        of_grid, pc_grid, z = self._gen_grid_(param_name)
+        spl = self._fit_spline(pc_grid, of_grid, z[1:-1, 1:-1])
+        self._spline_cache[param_name] = spl
+        return(spl)
+
+    def _load_species_stack(self, param_name):
+        """
+        Load every dataset in a folder, e.g. mole fractions of all chemical species,
+        and stack them into a single array. Datasets are read concurrently.
+        
+        Parameter
+        ---------
+        param_name: string
+            Folder name of datasets \n
+            e.g. "MoleFraction@Chamber"
+
+        Return
+        ------
+        names: list of string
+            dataset names in the folder, e.g. "MoleFraction@Chamber/H2O"
+        of_grid: 1-ndarray
+            O/F in ascending order
+        pc_grid: 1-ndarray
+            chamber pressure [MPa] in ascending order
+        zs: 3-ndarray, zs.shape -> (len(names), pc_grid.size+2, of_grid.size+2)
+            stack of values padded with ghost nodes, see _pad_linear()
+        """
+        names = [txt for txt in self.get_flist() if os.path.dirname(txt) == param_name]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            grids = list(executor.map(self._gen_grid_, names))
+        of_grid, pc_grid, _ = grids[0]     # all datasets share the same grid
+        zs = np.stack([grid[2] for grid in grids], axis=0)
+        return(names, of_grid, pc_grid, zs)
+
+    def gen_func(self, param_name, extraporate="linear", kind="cubic"):
         """
         Generate function of calculated parameter with respect to O/F and Pc.
         Return a value after reading csv file and interpolate the data.
@@ -126,13 +398,48 @@ class Read_datset:
             "power"
             "linear" Default; using linear function to extraporate
 
+        kind: string; optional
+            "cubic" Default; Catmull-Rom bicubic interpolation compiled by Numba
+            "spline": bicubic spline interpolation of FITPACK (scipy.interpolate.RectBivariateSpline)
+            "linear": bilinear interpolation compiled by Numba
+
         Return
         ------
         func: function(of, Pc)
-            A function which return a interpolated value (array-like)
+            A function which return a interpolated value (float).
+            The value is always a Python float regardless of self.dtype
+            and of whether it is interpolated or extrapolated.
         """
-        array = self._read_csv_(param_name)
-        func_interp = interpolate.interp2d(self.of, self.Pc, array.T, kind="cubic", bounds_error=False)
+        if (param_name, extraporate, kind) in self._func_cache:
+            return(self._func_cache[(param_name, extraporate, kind)])
+        of_grid, pc_grid, z = self._gen_grid_(param_name)
+        if kind == "spline":
+            spl = self._gen_spline_(param_name)
+            eval_point = lambda of, Pc: float(spl.ev(Pc, of))
+            eval_col = lambda Pc: spl.ev(np.full_like(of_grid, Pc), of_grid)
+        elif kind == "linear":
+            def eval_col(Pc):
+                j, u = locate(pc_grid, Pc)
+                return((1-u)*z[j+1, 1:-1] + u*z[j+2, 1:-1])
+            eval_point = lambda of, Pc: bilinear_eval(of_grid, pc_grid, z, of, Pc)
+        else:
+            eval_point = lambda of, Pc: bicubic_eval(of_grid, pc_grid, z, of, Pc)
+            eval_col = lambda Pc: bicubic_eval_col(of_grid, pc_grid, z, Pc)
+        of_min = float(of_grid[0])
+        of_max = float(of_grid[-1])
+        w_begin, w_end = _diff_weights(of_grid)
+        @functools.lru_cache(maxsize=256)
+        def _prep(Pc):
+            """Values along O/F and slopes at both ends of O/F, which depend only on Pc [MPa]
+            
+            Return
+            ----------
+            prep: tuple, (cstr_array, diff_begin, diff_end)
+            """
+            cstr_array = np.asarray(eval_col(Pc), dtype=np.float64)
+            diff_begin = w_begin[0]*cstr_array[0] + w_begin[1]*cstr_array[1] + w_begin[2]*cstr_array[2]
+            diff_end = w_end[0]*cstr_array[-3] + w_end[1]*cstr_array[-2] + w_end[2]*cstr_array[-1]
+            return(cstr_array, diff_begin, diff_end)
         def func(of, Pc):
             """Function to do interpolation and linear-extrapolation about the assigned database.
             Extrapolation is avalable only when assigned O/F is out of data-base range
@@ -150,7 +457,6 @@ class Read_datset:
                 interpolated or extrapolated value
             """
             Pc = Pc*1.0e-6
-            cstr_array = func_interp(self.of, Pc)
             def cea_exe(of, Pc):
                 """ Using single execute of CEA instead of not using extraporation 
                 
@@ -198,11 +504,11 @@ class Read_datset:
                 val= diff*(of-a) + b
                 return(val)
             
-            if of<self.of.min(): #when assigned O/F is smaller than minimum O/F of database
-                diff_begin = (-3*cstr_array[0] +4*cstr_array[1] -cstr_array[2])/(2*(self.of[1]-self.of[0]))
+            if of<of_min: #when assigned O/F is smaller than minimum O/F of database
+                cstr_array, diff_begin, _ = _prep(float(Pc))
                 # ddiff_begin = (2*cstr_array[0] -5*cstr_array[1] + 4*cstr_array[2] -cstr_array[3])/np.power((self.of[1]-self.of[0]),2.0)
                 # dddiff_begin = 
-                a = self.of.min()
+                a = of_min
                 b = cstr_array[0]
                 if extraporate == False:
                     val = cea_exe(of, Pc)
@@ -218,12 +524,12 @@ class Read_datset:
                 #     val = extrapfunc_power(of, a, b, diff_begin, ddiff_begin, dddiff_begin)
                 elif extraporate=="linear":
                     val = extrapfunc_linear(of, a, b, diff_begin)
-            elif self.of.max()<of: #when assigned O/F is larger than maximum O/F of database
-                diff_end = (cstr_array[len(cstr_array)-3] -4* cstr_array[len(cstr_array)-2] +3*cstr_array[len(cstr_array)-1])/(2*(self.of[len(self.of)-1]-self.of[len(self.of)-2]))
+            elif of_max<of: #when assigned O/F is larger than maximum O/F of database
+                cstr_array, _, diff_end = _prep(float(Pc))
                 # ddiff_end = (-2*cstr_array[len(cstr_array)-4] +4*cstr_array[len(cstr_array)-3] -5*cstr_array[len(cstr_array)-2] +2*cstr_array[len(cstr_array)-1])/np.power(self.of[len(self.of)-1]-self.of[len(self.of)-2], 2.0)
                 # dddiff_end = 
-                a = self.of.max()
-                b = cstr_array[len(cstr_array)-1]
+                a = of_max
+                b = cstr_array[-1]
                 if extraporate == False:
                     val = cea_exe(of, Pc)
                 # elif extraporate=="exp":
@@ -239,10 +545,95 @@ class Read_datset:
                 elif extraporate=="linear":
                     val = extrapfunc_linear(of, a, b, diff_end)
             else: #when assigned O/F is with in the range of O/F
-                    val = func_interp(of, Pc)[0]
+                    val = eval_point(of, Pc)
+            if val is not None:
+                val = float(val)    # same type for every path, even when datasets are stored as float32
             return(val)
         
+        self._func_cache[(param_name, extraporate, kind)] = func
         return(func)
+
+    def gen_func_vec(self, param_name, extraporate="linear", kind="cubic"):
+        """
+        Generate vectorized function of calculated parameter with respect to O/F and Pc.
+        The function evaluates whole arrays of O/F and Pc at once without Python loop.
+        
+        Parameter
+        ---------
+        param_name: string
+            Parameter name which is a dataset file name \n
+            e.g. "CSTAR", "GAMMAs", "T_c", "Cp_c"
+
+        extraporate: string or False; optional
+            "linear" Default; using linear function to extraporate the region out of O/F range
+            False: O/F out of data-base range is clamped to the edge of data-base
+
+        kind: string; optional
+            "cubic" Default; Catmull-Rom bicubic interpolation
+            "spline": bicubic spline interpolation of FITPACK (scipy.interpolate.RectBivariateSpline)
+            "linear": bilinear interpolation
+
+        Return
+        ------
+        func_vec: function(of, Pc)
+            A function which return interpolated values (ndarray of numpy.float64
+            regardless of self.dtype)
+        """
+        of_grid, pc_grid, z = self._gen_grid_(param_name)
+        if kind == "spline":
+            spl = self._gen_spline_(param_name)
+        of_min = of_grid[0]
+        of_max = of_grid[-1]
+        w_begin, w_end = _diff_weights(of_grid)
+        stencil = np.arange(4)
+        def interp(of, Pc):
+            """Interpolation of flat arrays of O/F and Pc [MPa], which are in data-base range"""
+            if kind == "spline":
+                return(spl.ev(Pc, of))
+            i = np.clip(np.searchsorted(of_grid, of, side="right")-1, 0, of_grid.size-2)
+            j = np.clip(np.searchsorted(pc_grid, Pc, side="right")-1, 0, pc_grid.size-2)
+            t = (of - of_grid[i])/(of_grid[i+1] - of_grid[i])
+            u = (Pc - pc_grid[j])/(pc_grid[j+1] - pc_grid[j])
+            if kind == "linear":
+                return((1-u)*((1-t)*z[j+1, i+1] + t*z[j+1, i+2]) + u*((1-t)*z[j+2, i+1] + t*z[j+2, i+2]))
+            bi = np.stack(catmull_rom(t), axis=1)
+            bj = np.stack(catmull_rom(u), axis=1)
+            return(np.einsum("mi,mj,mji->m", bi, bj, z[j[:,None,None]+stencil[:,None], i[:,None,None]+stencil]))
+        def func_vec(of, Pc):
+            """Function to do interpolation and linear-extrapolation about the assigned database.
+            Extrapolation is avalable only when assigned O/F is out of data-base range,
+            and Pc out of data-base range is clamped to the edge of data-base.
+            
+            Parameter
+            -----------
+            of: array-like,
+                O/F
+            Pc: array-like,
+                Chamber Pressure [Pa]; broadcasted with "of"
+            
+            Return
+            ----------
+            val: ndarray
+                interpolated or extrapolated values, which shape is the broadcasted shape of "of" and "Pc"
+            """
+            of, Pc = np.broadcast_arrays(np.asarray(of, dtype=np.float64), np.asarray(Pc, dtype=np.float64)*1.0e-6)
+            shape = of.shape
+            of = of.ravel()
+            Pc = np.clip(Pc.ravel(), pc_grid[0], pc_grid[-1])
+            val = interp(np.clip(of, of_min, of_max), Pc)
+            out = (of < of_min) | (of_max < of)
+            if extraporate == "linear" and out.any():
+                # edge slopes depend only on Pc, so they are evaluated once per unique Pc out of O/F range
+                of_out = of[out]
+                pc_uniq, inv = np.unique(Pc[out], return_inverse=True)
+                slope_begin, slope_end = (w[0]*interp(np.full(pc_uniq.size, nodes[0]), pc_uniq)
+                                          + w[1]*interp(np.full(pc_uniq.size, nodes[1]), pc_uniq)
+                                          + w[2]*interp(np.full(pc_uniq.size, nodes[2]), pc_uniq)
+                                          for nodes, w in ((of_grid[:3], w_begin), (of_grid[-3:], w_end)))
+                # in-range values are left untouched, so NaN slopes never leak into them
+                val[out] += np.where(of_out < of_min, (of_out-of_min)*slope_begin[inv], (of_out-of_max)*slope_end[inv])
+            return(val.reshape(shape))
+        return(func_vec)
         
     def plot(self, param_name, of_range, Pc_plot):    
         """
@@ -260,13 +651,16 @@ class Read_datset:
         Pc_plot: 1-ndarray
             This array contain the chamber pressure [Pa] which you want to plot a graph
         """
-        func = self.gen_func(param_name, extraporate="linear")
+        func_vec = self.gen_func_vec(param_name, extraporate="linear")
+        Pc_plot = np.asarray(Pc_plot)
+        val = func_vec(self.of, Pc_plot[:,None])
         plt.rcParams["font.family"] = "Times New Roman"
         plt.rcParams["font.size"] = 17
         fig = plt.figure(figsize=(8,6))
         ax = fig.add_subplot(111)
-        for Pc in Pc_plot:
-            ax.plot(self.of, np.array([func(of,Pc) for of in self.of]), label=r"$P_c$ = {} MPa".format(round(Pc*1.0e-6, 2)))
+        lines = ax.plot(self.of, val.T)    # create all lines in one call
+        for line, Pc in zip(lines, Pc_plot):
+            line.set_label(r"$P_c$ = {} MPa".format(round(Pc*1.0e-6, 2)))
         ax.legend(loc="best", fontsize=16)
         ax.set_xlabel(r"$O/F$ [-]")
         ax.set_ylabel("${}$".format(param_name))
@@ -290,21 +684,22 @@ class Read_datset:
         Pc_plot: 1-ndarray
             This array contain the chamber pressure [Pa] which you want to plot a graph
         """
-        paramlist = glob.glob(os.path.join(self.fld_path, param_name, "*.csv"))
-        # list of chemical species to input gen_func
-        paramlist = [txt.replace(".csv", "") for txt in paramlist]
-        paramlist = [txt.replace(os.path.join(self.fld_path, ""), "") for txt in paramlist]
+        # list of chemical species and its values stacked into one array
+        paramlist, of_grid, pc_grid, zs = self._load_species_stack(param_name)
         # list of chemical species to input figure legend
-        chemlist = [txt.replace(os.path.join(param_name, ""), "") for txt in paramlist]
+        plen = len(os.path.join(param_name, ""))   # every name in paramlist starts with this prefix
+        chemlist = [txt[plen:] for txt in paramlist]
 
         plt.rcParams["font.family"] = "Times New Roman"
         plt.rcParams["font.size"] = 20
         fig = plt.figure(figsize=(10,10))
         ax = fig.add_subplot(111)
 
-        for i in range(len(paramlist)):
-            func = self.gen_func(paramlist[i], extraporate="linear")
-            ax.plot(self.of, np.array([func(of,Pc_plot) for of in self.of]), label=chemlist[i])
+        # Pc_plot is a scalar, so only one column along O/F is evaluated for all species at once
+        vals = bicubic_eval_col_stack(pc_grid, zs, zs.dtype.type(Pc_plot*1.0e-6))
+        lines = ax.plot(of_grid, vals.T)    # create all lines in one call
+        for line, chem in zip(lines, chemlist):
+            line.set_label(chem)
         ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left", fontsize="xx-small", borderaxespad=0)
         ax.set_xlabel(r"$O/F$ [-]")
         ax.set_ylabel(param_name)
@@ -328,17 +723,10 @@ if __name__ == "__main__":
                 if os.path.exists(os.path.join(dbfld_path, param_name)) or os.path.exists(os.path.join(dbfld_path, param_name+".csv")):
                     flag = False
                 else:
-                    flist = glob.glob(os.path.join(dbfld_path, "*"))
-                    flist = [txt.replace(os.path.join(dbfld_path, ""), "") for txt in flist]
-                    flist = [txt.replace(".csv", "") for txt in flist]
+                    flist = sorted({txt.split(os.sep)[0] for txt in inst.get_flist()})
                     print("There is no such a data base. Please input the parameter name from the followings;\n")
                     print(flist)
-                    flist_mole = inst.get_flist()
-                    for name in flist:
-                        try:
-                            flist_mole.remove(name)
-                        except ValueError:
-                            pass
+                    flist_mole = [txt for txt in inst.get_flist() if os.sep in txt]
                     print(flist_mole)
 
             if param_name in ["MoleFraction@Chamber", "MoleFraction@Throat", "MoleFraction@Exit"]:
@@ -351,9 +739,11 @@ if __name__ == "__main__":
             else:
                 print("\n\nPlease input the range of O/F where you want to plot.\ne.g. If the range is 0.5 to 5.0 \n0.5 5.0")
                 of_range = list(map(lambda x: float(x) ,input(">> ").split()))
-                print("\n\nPlease input the range of Pc where you want to plot.\nRange: 0.2 ~ 99.99, Minimum interval: 00.1 MPa\ne.g. If the range is 0.5 to 5.1 MPa and the interval is 0.1 MPa\n0.5 5.0 0.1")
-                Pc_range = list(map(lambda x: float(x)*1.0e+6 ,input(">> ").split()))
-                Pc_plot = np.arange(Pc_range[0], Pc_range[1], Pc_range[2])
+                print("\n\nPlease input the range of Pc where you want to plot.\nRange: 0.2 ~ 99.99, Minimum interval: 00.1 MPa\ne.g. If the range is 0.5 to 5.0 MPa and the interval is 0.1 MPa\n0.5 5.0 0.1")
+                Pc_range = list(map(lambda x: float(x) ,input(">> ").split()))
+                # the end of range is included; the number of points does not suffer from rounding error like np.arange
+                num = int(round((Pc_range[1] - Pc_range[0])/Pc_range[2])) + 1
+                Pc_plot = np.linspace(Pc_range[0], Pc_range[1], num)*1.0e+6
                 inst.plot(param_name, of_range, Pc_plot)
                 break
         else:
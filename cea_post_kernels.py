@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+Numerical kernels of interpolation used by cea_post.py
+
+Brief Description:
+Catmull-Rom bicubic interpolation kernels over the ghost-padded grid
+generated by "cea_post._pad_linear()". The kernels are compiled by
+Numba at the first call and cached on disk. They can also be compiled
+ahead of time as the extension module "_cea_post_kernels_aot" by
+executing this file once, which removes the JIT latency at the first
+call; when the extension module exists, it is used instead. Execute
+this file again after the kernels are changed, because an extension
+module built from older kernels is ignored and the JIT kernels are used.
+
+This module provide some functions or classes as the followings;
+* locate: function for locating a query point in a grid.
+* catmull_rom: function for Catmull-Rom basis weights.
+* bicubic_eval: function for interpolation at a single point.
+* bicubic_eval_col: function for interpolation along every O/F node at a certain Pc.
+* bicubic_eval_col_stack: function for bicubic_eval_col over a stack of datasets.
+* bilinear_eval: function for bilinear interpolation at a single point.
+"""
+
+import os
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def locate(grid, x):
+    """
+    Return the index of the grid interval containing x and the local coordinate t in [0, 1].
+    x is clamped into the grid range.
+    """
+    n = grid.size
+    if x < grid[0]:
+        x = grid[0]
+    elif x > grid[n-1]:
+        x = grid[n-1]
+    k = np.searchsorted(grid, x, side="right") - 1
+    if k > n-2:
+        k = n-2
+    t = (x - grid[k])/(grid[k+1] - grid[k])
+    return(k, t)
+
+
+@njit(cache=True)
+def catmull_rom(t):
+    """
+    Return the four Catmull-Rom basis weights at the local coordinate t
+    """
+    t2 = t*t
+    t3 = t2*t
+    w0 = 0.5*(-t3 + 2*t2 - t)
+    w1 = 0.5*(3*t3 - 5*t2 + 2)
+    w2 = 0.5*(-3*t3 + 4*t2 + t)
+    w3 = 0.5*(t3 - t2)
+    return(w0, w1, w2, w3)
+
+
+@njit(cache=True)
+def bicubic_eval(of_grid, pc_grid, z, of, pc):
+    """
+    Bicubic (Catmull-Rom) interpolation at a single point.
+    Query points out of the grid are clamped to the nearest edge.
+
+    Parameter
+    ---------
+    of_grid: 1-ndarray
+        O/F grid in ascending order
+    pc_grid: 1-ndarray
+        Pc grid [MPa] in ascending order
+    z: 2-ndarray, z.shape -> (pc_grid.size+2, of_grid.size+2)
+        padded values generated by _pad_linear()
+    of: float
+        O/F
+    pc: float
+        chamber pressure [MPa]
+
+    Return
+    ------
+    val: float
+        interpolated value
+    """
+    i, t = locate(of_grid, of)
+    j, u = locate(pc_grid, pc)
+    wi = catmull_rom(t)
+    wj = catmull_rom(u)
+    val = 0.0
+    for b in range(4):
+        tmp = 0.0
+        for a in range(4):
+            tmp += wi[a]*z[j+b, i+a]
+        val += wj[b]*tmp
+    return(val)
+
+
+@njit(cache=True, parallel=True)
+def bicubic_eval_col(of_grid, pc_grid, z, pc):
+    """
+    Bicubic (Catmull-Rom) interpolation along every node of of_grid at a certain Pc.
+
+    Parameter
+    ---------
+    of_grid: 1-ndarray
+        O/F grid in ascending order
+    pc_grid: 1-ndarray
+        Pc grid [MPa] in ascending order
+    z: 2-ndarray, z.shape -> (pc_grid.size+2, of_grid.size+2)
+        padded values generated by _pad_linear()
+    pc: float
+        chamber pressure [MPa]
+
+    Return
+    ------
+    col: 1-ndarray, col.shape -> (of_grid.size,)
+        interpolated values at each O/F node
+    """
+    j, u = locate(pc_grid, pc)
+    wj = catmull_rom(u)
+    col = np.empty(of_grid.size, dtype=z.dtype)
+    for i in prange(of_grid.size):
+        tmp = 0.0
+        for b in range(4):
+            tmp += wj[b]*z[j+b, i+1]
+        col[i] = tmp
+    return(col)
+
+
+@njit(cache=True, parallel=True)
+def bicubic_eval_col_stack(pc_grid, zs, pc):
+    """
+    bicubic_eval_col() for a stack of datasets sharing the same grid,
+    e.g. mole fractions of all chemical species. Datasets are evaluated in parallel.
+
+    Parameter
+    ---------
+    pc_grid: 1-ndarray
+        Pc grid [MPa] in ascending order
+    zs: 3-ndarray, zs.shape -> (n_dataset, pc_grid.size+2, of_grid.size+2)
+        stack of padded values generated by _pad_linear()
+    pc: float
+        chamber pressure [MPa]
+
+    Return
+    ------
+    cols: 2-ndarray, cols.shape -> (n_dataset, of_grid.size)
+        interpolated values at each O/F node for each dataset
+    """
+    j, u = locate(pc_grid, pc)
+    wj = catmull_rom(u)
+    n_of = zs.shape[2] - 2
+    cols = np.empty((zs.shape[0], n_of), dtype=zs.dtype)
+    for s in prange(zs.shape[0]):
+        for i in range(n_of):
+            tmp = 0.0
+            for b in range(4):
+                tmp += wj[b]*zs[s, j+b, i+1]
+            cols[s, i] = tmp
+    return(cols)
+
+
+@njit(cache=True, fastmath=True)
+def bilinear_eval(of_grid, pc_grid, z, of, pc):
+    """
+    Bilinear interpolation at a single point.
+    Query points out of the grid are clamped to the nearest edge.
+
+    Parameter
+    ---------
+    of_grid: 1-ndarray
+        O/F grid in ascending order
+    pc_grid: 1-ndarray
+        Pc grid [MPa] in ascending order
+    z: 2-ndarray, z.shape -> (pc_grid.size+2, of_grid.size+2)
+        padded values generated by _pad_linear()
+    of: float
+        O/F
+    pc: float
+        chamber pressure [MPa]
+
+    Return
+    ------
+    val: float
+        interpolated value
+    """
+    i, t = locate(of_grid, of)
+    j, u = locate(pc_grid, pc)
+    val = (1-u)*((1-t)*z[j+1, i+1] + t*z[j+1, i+2]) + u*((1-t)*z[j+2, i+1] + t*z[j+2, i+2])
+    return(val)
+
+
+_AOT_VERSION = 1    # increment whenever the exported kernels or their signatures change
+# {exported name: (JIT kernel name, signature)}
+_AOT_EXPORTS = {"eval_scalar": ("bicubic_eval", "f8(f8[:], f8[:], f8[:,:], f8, f8)"),
+                "eval_column": ("bicubic_eval_col", "f8[:](f8[:], f8[:], f8[:,:], f8)"),
+                "eval_column_stack": ("bicubic_eval_col_stack", "f8[:,:](f8[:], f8[:,:,:], f8)"),
+                "eval_scalar_f4": ("bicubic_eval", "f4(f4[:], f4[:], f4[:,:], f4, f4)"),
+                "eval_column_f4": ("bicubic_eval_col", "f4[:](f4[:], f4[:], f4[:,:], f4)"),
+                "eval_column_stack_f4": ("bicubic_eval_col_stack", "f4[:,:](f4[:], f4[:,:,:], f4)"),
+                }
+
+
+@njit(cache=True)
+def _aot_version():
+    """
+    Return the version of kernels, which is exported to the extension module to detect a stale build
+    """
+    return(_AOT_VERSION)
+
+
+def _load_aot():
+    """
+    Import the ahead-of-time compiled extension module.
+    A stale build, which lacks any entry point or has another version, is ignored.
+
+    Return
+    ------
+    aot: module or None
+        None when the extension module is not available
+    """
+    try:
+        import _cea_post_kernels_aot as aot
+    except ImportError:
+        return(None)
+    if not all(hasattr(aot, name) for name in _AOT_EXPORTS) or not hasattr(aot, "kernels_version"):
+        return(None)
+    if aot.kernels_version() != _AOT_VERSION:
+        return(None)
+    return(aot)
+
+
+# replace the JIT kernels with the ahead-of-time compiled ones, if they have been built.
+# When this file is executed to build the extension, the JIT kernels are kept as they are.
+_aot = None if __name__ == "__main__" else _load_aot()
+if _aot is not None:
+    def bicubic_eval(of_grid, pc_grid, z, of, pc):
+        if z.dtype == np.float32:
+            return(_aot.eval_scalar_f4(of_grid, pc_grid, z, of, pc))
+        return(_aot.eval_scalar(of_grid, pc_grid, z, of, pc))
+
+    def bicubic_eval_col(of_grid, pc_grid, z, pc):
+        if z.dtype == np.float32:
+            return(_aot.eval_column_f4(of_grid, pc_grid, z, pc))
+        return(_aot.eval_column(of_grid, pc_grid, z, pc))
+
+    def bicubic_eval_col_stack(pc_grid, zs, pc):
+        if zs.dtype == np.float32:
+            return(_aot.eval_column_stack_f4(pc_grid, zs, pc))
+        return(_aot.eval_column_stack(pc_grid, zs, pc))
+
+
+if __name__ == "__main__":
+    from numba.pycc import CC
+    cc = CC("_cea_post_kernels_aot")
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    for name, (kernel, signature) in _AOT_EXPORTS.items():
+        cc.export(name, signature)(globals()[kernel].py_func)
+    cc.export("kernels_version", "i8()")(_aot_version.py_func)
+    cc.compile()
@@ -8,12 +8,16 @@ as a command line. Generated .inp files will be located in the
 assigned case name folder under "cea_db/inp" directory. Also
 you can utilize indivisual functions such as "make_inp()", 
 "make_inp_name()" for generating one specific .inp file.
+When an existing "cond.json" is assigned by "--cond" option,
+.inp files are generated without any question through CUI.
 
 This module provide some functions or classes as the followings;
 * make_inp: function for generating one specific .inp file, when
             you assign chem species as "oxid" and "fuel" in *.inp.
 * make_inp_name: function for generating one specific .inp file, when
             you assign chem species as "name" in *.inp.
+* make_inp_text, make_inp_name_text: functions returning the file name
+            and the lines of .inp file without writing it.
 * Cui_input: class for assigning conditions and generating .inp files
 
 Author: T.J.
@@ -23,11 +27,114 @@ Version: 3.1.0 (BETA)
 """
 
 import os
-import copy
-import numpy as np
-import pandas as pd
+import math
+import pathlib
 import json
-from tqdm import tqdm
+from itertools import product
+from types import MappingProxyType
+
+# key of question sentence for each field and each "fuel", "oxid" or "other"
+_PROMPT_KEYS = {"name": {"fuel": "fuel", "oxid": "oxid", "other": "other"},
+                "wt": {"fuel": "f_wt", "oxid": "o_wt", "other": "ot_wt"},
+                "temp": {"fuel": "f_itemp", "oxid": "o_itemp", "other": "ot_itemp"},
+                "h": {"fuel": "f_enthlpy", "oxid": "o_enthlpy", "other": "ot_enthlpy"},
+                "elem": {"fuel": "f_elem", "oxid": "o_elem", "other": "ot_elem"}}
+
+# question sentences of Cui_input in each language; {key: {lang: sentence, ...}, ...}
+_SENTENCES = dict()
+_SENTENCES["option"] = {"jp": "\n計算オプション(0~2)を選択してください．\n例: 0: 全域平衡計算\n    1: 燃焼器内のみ平衡計算\n    2: スロートまで平衡計算",
+                 "en": "\nPlease select option (0-2) of calculation.\ne.g.: 0: equilibrium during expansion\n      1: frozen after the end of chamber\n      2: frozen after nozzle throat"}
+
+_SENTENCES["oxid"] = {"jp": "\n酸化剤の種類を入力してください.\n*記号はNASA RP-1311-P2 app.B に準拠\n例: O2(L)",
+                 "en": "\nPlease input oxidizer name.\n*Concerning spiecies name, please refer \"NASA RP-1311-P2 app.B.\"\ne.g.: O2(L)"}
+
+_SENTENCES["fuel"] = {"jp": "\n燃料の名前を入力してください\n例: PMMA",
+                 "en": "\nPlease input fuel name.\"\ne.g.: PMMA"}
+
+_SENTENCES["other"] = {"jp": "\nその他の物質の名前を入力してください\n例: N2",
+                  "en": "\nPlease input the names of other chemical species.\"\ne.g.: N2"}
+
+_SENTENCES["omit"] = {"jp": "\n計算から除外したい物質の名前を半角スペースで区切って入力してください\n例: C(gr) H2O(cr)",
+                  "en": "\nPlease input the names of chemical species for omitting from calculation with separating by a space.\"\ne.g.: C(gr) H2O(cr)"} 
+
+_SENTENCES["only"] = {"jp": "\n計算で考慮する化学種を限定したい物質の名前を半角スペースで区切って入力してください\n例: CO2 H2O CO OH",
+                  "en": "\nPlease input the names of chemical species for manually assigning in the calculation with separating by a space.\"\ne.g.:  CO2 H2O CO OH"}    
+
+_SENTENCES["o_wt"] = {"jp": "\n酸化剤の質量分率[%]を入力してください",
+                 "en": "\nPlease input oxidizer mass fraction [%]"}
+
+_SENTENCES["f_wt"] = {"jp": "\n燃料の質量分率[%]を入力してください",
+                 "en": "\nPlease input fuel mass fraction [%]"}
+
+_SENTENCES["ot_wt"] = {"jp": "\nその他の化学物質の質量分率[%]を入力してください\n注：推進剤全体に対する質量分率です　この値は固定されます",
+                  "en": "\nPlease input the mass fraction of other chemical species [%]\nnote: the mass fraction is for all propellant mass This value is fixed at every O/F condition"}
+
+_SENTENCES["o_itemp"] = {"jp": "\n酸化剤の初期温度[K]を入力してください",
+                 "en": "\nPlease input initial oxidizer temperature [K]"}
+
+_SENTENCES["f_itemp"] = {"jp": "\n燃料の初期温度[K]を入力してください",
+                 "en": "\nPlease input initial fuel temperature [K]"}
+
+_SENTENCES["ot_itemp"] = {"jp": "\nその他の化学種の初期温度[K]を入力してください",
+                     "en": "\nPlease input the initial fuel temperature of other chemical species [K]"}
+
+_SENTENCES["o_enthlpy"] = {"jp": "\n酸化剤の標準生成エンタルピ[kJ/mol]を入力してください",
+                 "en": "\nPlease input standard enthalpy of formation [kJ/mol] respect to oxidizer"}
+
+_SENTENCES["f_enthlpy"] = {"jp": "\n燃料の標準生成エンタルピ[kJ/mol]を入力してください",
+                 "en": "\nPlease input standard enthalpy of formation [kJ/mol] respect to fuel"}
+
+_SENTENCES["ot_enthlpy"] = {"jp": "\nその他の化学種の標準生成エンタルピ[kJ/mol]を入力してください",
+                       "en": "\nPlease input standard enthalpy of formation [kJ/mol] respect to other chemical species"}
+
+_SENTENCES["o_elem"] = {"jp": "\n1molの酸化剤に含まれる元素とそのmol数を入力してください.\n例: N 2 O 1",
+                 "en": "\nPlease input the element symbols and its mol number contained per 1 mol of oxidizer\ne.g.: N 2 O 1"}
+
+_SENTENCES["f_elem"] = {"jp": "\n1molの燃料に含まれる元素とそのmol数を入力してください.\n例: C 5 H 2 O 6",
+                 "en": "\nPlease input the element symbols and its mol number contained per 1 mol of fuel\ne.g.: C 5 H 2 O 6"}
+
+_SENTENCES["ot_elem"] = {"jp": "\n1molの化学種に含まれる元素とそのmol数を入力してください.\n例: C 5 H 2 O 6",
+                    "en": "\nPlease input the element symbols and its mol number contained per 1 mol of chemical species\ne.g.: N 2"}
+
+_SENTENCES["eps"] = {"jp": "\n開口比Ae/Atを入力してください.",
+                "en": "\nPlease input the area ratio, Ae/At."}
+
+_SENTENCES["of"] = {"jp": "\n計算するO/Fの範囲を入力してください.\n許容範囲：0.01~99.99 , 最小刻み幅：0.01\n例) 0.5~10 を 0.1毎に計算する場合.\n0.5　10.1　0.1",
+            "en": "\nPlease input the range of O/F where you want to calculate.\nRange: 0.01 ~ 99.99, Minimum interval: 00.1\ne.g. If the range is 0.5 to 10 and the interval is 0.1\n0.5 10.1 0.1"}
+
+_SENTENCES["Pc"] = {"jp": "\n\n計算する燃焼室圧力[MPa]の範囲を入力してください.\n許容範囲：0.2~100 MPa, 最小刻み幅：0.01　MPa\n例) 0.5~5.0 MPa を 0.1 MPa毎に計算する場合.\n0.5　5.1　0.1",
+            "en": "\nPlease input the range of Chamber pressure [MPa] where you want to calculate.\nRange: 0.2~100 MPa, Minimum interval: 0.01 MPa\ne.g. If the range is 0.5 to 5.1 MPa and the interval is 0.1 MPa\n0.5 5.0 0.1"}
+
+_SENTENCES["cont_react"] = {"jp": "\n化学種の入力を続けますか? \"y/n\"",
+            "en": "\nDo you want to continue inputting reactant information? \"y/n\""}
+
+_SENTENCES["cont_enthlpy"] = {"jp": "\n標準生成エンタルピと構成元素を手動入力しますか? \"y/n\"",
+            "en": "\nDo you want to manually input standard enthalpy and constitution of element? \"y/n\""}
+
+_SENTENCES["cont_other"] = {"jp": "\n酸化剤または燃料以外の物質を入力しますか? \n注：ここで入力された物質は後に指定するO/Fによらず以下で指定する割合で含まれるようになります \"y/n\"",
+                  "en": "\nDo you want to assign other chemical species which are not oxidizer or fuel?\
+                             \nnote: Assigned species at the following query will be contained in the propellant with a certain mass fraction, which is not affected by assigned O/F \"y/n\""}
+
+_SENTENCES["cont_omit"] = {"jp": "\n計算から除外したい物質を入力しますか? \"y/n\"",
+                  "en": "\nDo you want to assign chemical species for omitting from calculation? \"y/n\""}
+
+_SENTENCES["cont_only"] = {"jp": "\n計算で考慮する物質を手動で入力しますか? \"y/n\"",
+                  "en": "\nDo you want to manually assign chemical species considered in calculation? \"y/n\""}
+
+_SENTENCES["confirm"] = {"jp": "\n入力した内容は正確ですか? \"y/n\"",
+            "en": "\nIs the inputted data correct? \"y/n\""}
+
+_SENTENCES["edit_react"] = {"jp": "\n修正する化学種の番号を入力してください.\n例: 0",
+            "en": "\nPlease input the number of chemical species to correct.\ne.g.: 0"}
+
+_SENTENCES["jsconf"] = {"jp": "\n既に存在する cond.json ファイルから計算条件を読み込みますか？ \"y/n\"",
+            "en": "\nDo you want to read the calculating conditioin from existing \"cond.json\"? \"y/n\""}
+
+_SENTENCES["casename"] = {"jp": "\n計算ケース名（フォルダ名）を入力して下さい．",
+            "en": "\nInput a Case Name (Folder Name)"}
+
+_SENTENCES = MappingProxyType(_SENTENCES)   # read-only
+
 
 class Cui_input():
     """
@@ -38,11 +145,11 @@ class Cui_input():
     langlist: list ["jp","en",...]
         Contain initial two characters of language name.
     
-    sntns_df : dict {outer_key: innerdict, ...}
-        outer_key: string\n
+    sntns : dict {key: sentence, ...}
+        key: string\n
             it is representative of the questionaire type. \n
-        innerdict: string\n
-            it is a questionaier sentense.
+        sentence: string\n
+            it is a questionaier sentense in the selected language.
 
     lang: string
         Selected language from the "langlist"
@@ -77,102 +184,28 @@ class Cui_input():
     """
     
     langlist = ["jp","en"]
-    _tmp_ = dict()
-    _tmp_["option"] = {"jp": "\n計算オプション(0~2)を選択してください．\n例: 0: 全域平衡計算\n    1: 燃焼器内のみ平衡計算\n    2: スロートまで平衡計算",
-                     "en": "\nPlease select option (0-2) of calculation.\ne.g.: 0: equilibrium during expansion\n      1: frozen after the end of chamber\n      2: frozen after nozzle throat"}
-
-    _tmp_["oxid"] = {"jp": "\n酸化剤の種類を入力してください.\n*記号はNASA RP-1311-P2 app.B に準拠\n例: O2(L)",
-                     "en": "\nPlease input oxidizer name.\n*Concerning spiecies name, please refer \"NASA RP-1311-P2 app.B.\"\ne.g.: O2(L)"}
-
-    _tmp_["fuel"] = {"jp": "\n燃料の名前を入力してください\n例: PMMA",
-                     "en": "\nPlease input fuel name.\"\ne.g.: PMMA"}
-
-    _tmp_["other"] = {"jp": "\nその他の物質の名前を入力してください\n例: N2",
-                      "en": "\nPlease input the names of other chemical species.\"\ne.g.: N2"}
-
-    _tmp_["omit"] = {"jp": "\n計算から除外したい物質の名前を半角スペースで区切って入力してください\n例: C(gr) H2O(cr)",
-                      "en": "\nPlease input the names of chemical species for omitting from calculation with separating by a space.\"\ne.g.: C(gr) H2O(cr)"} 
-
-    _tmp_["only"] = {"jp": "\n計算で考慮する化学種を限定したい物質の名前を半角スペースで区切って入力してください\n例: CO2 H2O CO OH",
-                      "en": "\nPlease input the names of chemical species for manually assigning in the calculation with separating by a space.\"\ne.g.:  CO2 H2O CO OH"}    
-
-    _tmp_["o_wt"] = {"jp": "\n酸化剤の質量分率[%]を入力してください",
-                     "en": "\nPlease input oxidizer mass fraction [%]"}
-    
-    _tmp_["f_wt"] = {"jp": "\n燃料の質量分率[%]を入力してください",
-                     "en": "\nPlease input fuel mass fraction [%]"}
-
-    _tmp_["ot_wt"] = {"jp": "\nその他の化学物質の質量分率[%]を入力してください\n注：推進剤全体に対する質量分率です　この値は固定されます",
-                      "en": "\nPlease input the mass fraction of other chemical species [%]\nnote: the mass fraction is for all propellant mass This value is fixed at every O/F condition"}
-
-    _tmp_["o_itemp"] = {"jp": "\n酸化剤の初期温度[K]を入力してください",
-                     "en": "\nPlease input initial oxidizer temperature [K]"}
-    
-    _tmp_["f_itemp"] = {"jp": "\n燃料の初期温度[K]を入力してください",
-                     "en": "\nPlease input initial fuel temperature [K]"}
-
-    _tmp_["ot_itemp"] = {"jp": "\nその他の化学種の初期温度[K]を入力してください",
-                         "en": "\nPlease input the initial fuel temperature of other chemical species [K]"}
-
-    _tmp_["o_enthlpy"] = {"jp": "\n酸化剤の標準生成エンタルピ[kJ/mol]を入力してください",
-                     "en": "\nPlease input standard enthalpy of formation [kJ/mol] respect to oxidizer"}
-    
-    _tmp_["f_enthlpy"] = {"jp": "\n燃料の標準生成エンタルピ[kJ/mol]を入力してください",
-                     "en": "\nPlease input standard enthalpy of formation [kJ/mol] respect to fuel"}
-
-    _tmp_["ot_enthlpy"] = {"jp": "\nその他の化学種の標準生成エンタルピ[kJ/mol]を入力してください",
-                           "en": "\nPlease input standard enthalpy of formation [kJ/mol] respect to other chemical species"}
-
-    _tmp_["o_elem"] = {"jp": "\n1molの酸化剤に含まれる元素とそのmol数を入力してください.\n例: N 2 O 1",
-                     "en": "\nPlease input the element symbols and its mol number contained per 1 mol of oxidizer\ne.g.: N 2 O 1"}
-    
-    _tmp_["f_elem"] = {"jp": "\n1molの燃料に含まれる元素とそのmol数を入力してください.\n例: C 5 H 2 O 6",
-                     "en": "\nPlease input the element symbols and its mol number contained per 1 mol of fuel\ne.g.: C 5 H 2 O 6"}
-
-    _tmp_["ot_elem"] = {"jp": "\n1molの化学種に含まれる元素とそのmol数を入力してください.\n例: C 5 H 2 O 6",
-                        "en": "\nPlease input the element symbols and its mol number contained per 1 mol of chemical species\ne.g.: N 2"}
-
-    _tmp_["eps"] = {"jp": "\n開口比Ae/Atを入力してください.",
-                    "en": "\nPlease input the area ratio, Ae/At."}
-    
-    _tmp_["of"] = {"jp": "\n計算するO/Fの範囲を入力してください.\n許容範囲：0.01~99.99 , 最小刻み幅：0.01\n例) 0.5~10 を 0.1毎に計算する場合.\n0.5　10.1　0.1",
-                "en": "\nPlease input the range of O/F where you want to calculate.\nRange: 0.01 ~ 99.99, Minimum interval: 00.1\ne.g. If the range is 0.5 to 10 and the interval is 0.1\n0.5 10.1 0.1"}
-
-    _tmp_["Pc"] = {"jp": "\n\n計算する燃焼室圧力[MPa]の範囲を入力してください.\n許容範囲：0.2~100 MPa, 最小刻み幅：0.01　MPa\n例) 0.5~5.0 MPa を 0.1 MPa毎に計算する場合.\n0.5　5.1　0.1",
-                "en": "\nPlease input the range of Chamber pressure [MPa] where you want to calculate.\nRange: 0.2~100 MPa, Minimum interval: 0.01 MPa\ne.g. If the range is 0.5 to 5.1 MPa and the interval is 0.1 MPa\n0.5 5.0 0.1"}
 
-    _tmp_["cont_react"] = {"jp": "\n化学種の入力を続けますか? \"y/n\"",
-                "en": "\nDo you want to continue inputting reactant information? \"y/n\""}
-
-    _tmp_["cont_enthlpy"] = {"jp": "\n標準生成エンタルピと構成元素を手動入力しますか? \"y/n\"",
-                "en": "\nDo you want to manually input standard enthalpy and constitution of element? \"y/n\""}
-
-    _tmp_["cont_other"] = {"jp": "\n酸化剤または燃料以外の物質を入力しますか? \n注：ここで入力された物質は後に指定するO/Fによらず以下で指定する割合で含まれるようになります \"y/n\"",
-                      "en": "\nDo you want to assign other chemical species which are not oxidizer or fuel?\
-                             \nnote: Assigned species at the following query will be contained in the propellant with a certain mass fraction, which is not affected by assigned O/F \"y/n\""}
-
-    _tmp_["cont_omit"] = {"jp": "\n計算から除外したい物質を入力しますか? \"y/n\"",
-                      "en": "\nDo you want to assign chemical species for omitting from calculation? \"y/n\""}
-
-    _tmp_["cont_only"] = {"jp": "\n計算で考慮する物質を手動で入力しますか? \"y/n\"",
-                      "en": "\nDo you want to manually assign chemical species considered in calculation? \"y/n\""}
-
-    _tmp_["confirm"] = {"jp": "\n入力した内容は正確ですか? \"y/n\"",
-                "en": "\nIs the inputted data correct? \"y/n\""}
-
-    _tmp_["jsconf"] = {"jp": "\n既に存在する cond.json ファイルから計算条件を読み込みますか？ \"y/n\"",
-                "en": "\nDo you want to read the calculating conditioin from existing \"cond.json\"? \"y/n\""}
-
-    _tmp_["casename"] = {"jp": "\n計算ケース名（フォルダ名）を入力して下さい．",
-                "en": "\nInput a Case Name (Folder Name)"}
-   
-
-    def __init__(self):
-        self.sntns_df = pd.DataFrame([], columns=self.langlist)
-        for i in self._tmp_:    # read and contain question sentense list to pandas data-frame
-            self.sntns_df = self.sntns_df.append(pd.DataFrame(self._tmp_[i], index=[i]))
-        self._inp_lang_()   # Language selection
-        self.fld_path = self._getpath_()    # get folder path
+    def __init__(self, fld_path=None, lang=None):
+        """
+        Parameters
+        ----------
+        fld_path : string, optional
+            Folder's path of the calculation case, e.g. "cea_db/O2+PMMA".
+            It is asked through CUI by default.
+        lang : string, optional
+            Language selected from the "langlist". It is asked through CUI by default.
+        """
+        if lang is None:
+            self._inp_lang_()   # Language selection
+        elif lang in self.langlist:
+            self.lang = lang
+        else:
+            raise ValueError("There is no such language set: \"{}\"; select from {}".format(lang, self.langlist))
+        self.sntns = {key: dic[self.lang] for key, dic in _SENTENCES.items()}   # question sentences in the selected language
+        if fld_path is None:
+            self.fld_path = self._getpath_()    # get folder path
+        else:
+            self.fld_path = str(pathlib.Path(fld_path).resolve())   # the folder is made later if it does not exist
         if os.path.exists(os.path.join(self.fld_path, "cond.json")):
             ## when read a calculating condition from cond.json, flag == True, if not, flag == False
             flag = self._conf_readjs_()
@@ -201,6 +234,25 @@ class Cui_input():
             self._inp_of_()     # get calcuating O/F range
             self._inp_Pc_()     # get calcuating Pc range
 
+    @classmethod
+    def from_json(cls, fldpath):
+        """
+        Generate an instance from an existing "cond.json" without any question through CUI
+        
+        Parameters
+        ----------
+        fldpath : string
+            folder path which contains "cond.json", e.g. "cea_db/O2+PMMA"
+
+        Return
+        ------
+        inst: Cui_input
+        """
+        inst = cls.__new__(cls)
+        inst.fld_path = fldpath
+        inst._read_json_(fldpath)
+        return(inst)
+
     def _inp_lang_(self):
         """
         Select user language
@@ -217,11 +269,32 @@ class Cui_input():
         Return the folder path which will cantain cea files: .inp, .out and csv cea-database
         """
         cadir = os.path.dirname(os.path.abspath(__file__))
-        print(self.sntns_df[self.lang]["casename"])
+        print(self.sntns["casename"])
         foldername = str(input(">> "))
         path = os.path.join(cadir, "cea_db", foldername)
         return(path)
 
+    def _ask_yn(self, key):
+        """
+        Ask a "y/n" question until the answer is "y" or "n"
+
+        Parameters
+        ----------
+        key: string
+            key of question sentence
+
+        Return
+        -------
+        res: bool
+            True when the answer is "y"
+        """
+        while True:
+            print(self.sntns[key])
+            option = input(">> ").strip().lower()
+            if option in ("y", "n"):
+                return(option == "y")
+            print("Please re-confirm the input answer. Input \"y\" or \"n\"")
+
     def _conf_readjs_(self):
         """
         Confirm whether reading a json condition file or not.
@@ -230,150 +303,123 @@ class Cui_input():
         -------
         flag: bool
         """
-        while True:
-            print(self.sntns_df[self.lang]["jsconf"])
-            option = str(input(">> "))
-            if option == "y":
-                flag = True
-                break
-            elif option == "n":
-                flag = False
-                break
-            else:
-                print("Please re-confirm the input answer. Input \"y\" or \"n\"")
-        return flag
+        return(self._ask_yn("jsconf"))
 
     def _inp_option_(self):
         """
         Select a option of calculation: whether equilibrium or frozen composition.
         """
-        print(self.sntns_df[self.lang]["option"])
-        option = int(input(">> "))
-        if option == 0:
-            option = "equilibrium"
-        elif option == 1:
-            option = "frozen nfz=1" # frozen composition after the end of chamber
-        elif option == 2:
-            option = "frozen nfz=2" # frozen composition after nozzle throat
-        else:
+        options = {"0": "equilibrium",
+                   "1": "frozen nfz=1",   # frozen composition after the end of chamber
+                   "2": "frozen nfz=2"}   # frozen composition after nozzle throat
+        while True:
+            print(self.sntns["option"])
+            option = input(">> ").strip()
+            if option in options:
+                break
             print("Please re-confirm input integer!")
-        self.option = option
+        self.option = options[option]
 
     def _inp_option_other_(self):
         """
         Select an option whether assign other chemical species, which are not oxid or fuel, or not.
         """
-        while True:
-            print(self.sntns_df[self.lang]["cont_other"])
-            option = str(input(">> "))
-            if option == "y":
-                res = True
-                break
-            elif option == "n":
-                res = False
-                break
-            else:
-                print("Please re-confirm the input answer. Input \"y\" or \"n\"")
-        return res
+        return(self._ask_yn("cont_other"))
 
     def _inp_react_(self, ident):
         """
         Input chemical species as just a type of "name".
+        When the inputted data is not correct, only the selected entry is input again.
         """
+        list_react = []
+        while(True):
+            list_react.append(self._inp_react_entry_(ident))
+            if not self._ask_yn("cont_react"):
+                break
         while(True):
-            list_react = []
+            print("")
+            for i, dic in enumerate(list_react):
+                print(i, dic)
+            if self._ask_yn("confirm"):
+                break
             while(True):
-                name = self._inp_name_(ident)
-                wt = self._inp_wt_(ident)
-                temp = self._inp_temp_(ident)
-                print(self.sntns_df[self.lang]["cont_enthlpy"])
-                flag = input(">> ")
-                if flag == "y":
-                    enthalpy = self._inp_enthlpy_(ident)
-                    elem = self._inp_elem_(ident)
-                else:
-                    enthalpy = ""
-                    elem = ""
-                list_react.append({"name": name,
-                                  "wt": wt,
-                                  "temp": temp,
-                                  "h": enthalpy,
-                                  "elem": elem})
-                print(self.sntns_df[self.lang]["cont_react"])
-                flag = input(">> ")
-                if flag == "n":
+                print(self.sntns["edit_react"])
+                index = input(">> ").strip()
+                if index.isdigit() and int(index) < len(list_react):
                     break
-            print(self.sntns_df[self.lang]["confirm"])
-            print(list_react)
-            flag = input(">> ")
-            if flag == "y":
-                break
+                print("Please re-confirm the input number. Input an integer from 0 to {}".format(len(list_react)-1))
+            list_react[int(index)] = self._inp_react_entry_(ident)
         return(list_react)
 
+    def _inp_react_entry_(self, ident):
+        """
+        Input one chemical species of "fuel", "oxid" or "other".
+
+        Return
+        ------
+        dic: dict
+            dict{"name": name, "wt": weight fraction %, "temp": initial temperature K, "h": enthalpy kJ/mol, "elem": element}
+        """
+        name = self._inp_name_(ident)
+        wt = self._inp_wt_(ident)
+        temp = self._inp_temp_(ident)
+        if self._ask_yn("cont_enthlpy"):
+            enthalpy = self._inp_enthlpy_(ident)
+            elem = self._inp_elem_(ident)
+        else:
+            enthalpy = ""
+            elem = ""
+        return({"name": name,
+                "wt": wt,
+                "temp": temp,
+                "h": enthalpy,
+                "elem": elem})
+
+    def _ask(self, field, ident, cast=str):
+        """
+        Print the question sentence of a field about oxidizer, fuel or other species, and return the answer
+        
+        Parameters
+        ----------
+        field: string
+            key of _PROMPT_KEYS, "name", "wt", "temp", "h" or "elem"
+        ident: string
+            "fuel", "oxid" or "other"
+        cast: function, optional
+            type conversion of the answer
+        """
+        print(self.sntns[_PROMPT_KEYS[field][ident]])
+        return(cast(input(">> ")))
+
     def _inp_name_(self, ident):
         """
         Input chemical species as "fuel", "oxid", or "name".
         """
-        if ident == "fuel":
-            print(self.sntns_df[self.lang]["fuel"])
-        elif ident == "oxid":
-            print(self.sntns_df[self.lang]["oxid"])
-        elif ident == "other":
-            print(self.sntns_df[self.lang]["other"])
-        name = input(">> ")
-        return(name)
+        return(self._ask("name", ident))
 
     def _inp_wt_(self, ident):
         """
         Input weight fraction of oxidizer, fuel or other species
         """
-        if ident == "fuel":
-            print(self.sntns_df[self.lang]["f_wt"])
-        elif ident == "oxid":
-            print(self.sntns_df[self.lang]["o_wt"])
-        elif ident == "other":
-            print(self.sntns_df[self.lang]["ot_wt"])
-        wt = float(input(">> "))
-        return(wt)
+        return(self._ask("wt", ident, float))
 
     def _inp_temp_(self, ident):
         """
         Input initial temperature of propellant
         """
-        if ident == "fuel":
-            print(self.sntns_df[self.lang]["f_itemp"])
-        elif ident == "oxid":
-            print(self.sntns_df[self.lang]["o_itemp"])
-        elif ident == "other":
-            print(self.sntns_df[self.lang]["ot_itemp"])            
-        temp = float(input(">> "))
-        return(temp)
+        return(self._ask("temp", ident, float))
     
     def _inp_enthlpy_(self, ident):
         """
         Input fuel standard enthalpy of formation
         """
-        if ident == "fuel":
-            print(self.sntns_df[self.lang]["f_enthlpy"])
-        elif ident == "oxid":
-            print(self.sntns_df[self.lang]["o_enthlpy"])
-        elif ident == "other":
-            print(self.sntns_df[self.lang]["ot_enthlpy"])
-        enthalpy = float(input(">> "))
-        return(enthalpy)
+        return(self._ask("h", ident, float))
         
     def _inp_elem_(self, ident):
         """
         Input element contained in fuel and its mol number contained in per 1 mol
         """
-        if ident == "fuel":
-            print(self.sntns_df[self.lang]["f_elem"])
-        elif ident == "oxid":
-            print(self.sntns_df[self.lang]["o_elem"])
-        elif ident == "other":
-            print(self.sntns_df[self.lang]["ot_elem"])
-        elem = input(">> ")
-        return(elem)
+        return(self._ask("elem", ident))
 
     def _inp_omit_only_list_(self, mode):
         """
@@ -381,9 +427,9 @@ class Cui_input():
         This method for "omit" and "only" optioin in NASA-CEA.
         """
         if mode == "omit": 
-            print(self.sntns_df[self.lang]["omit"])
+            print(self.sntns["omit"])
         elif mode == "only":
-            print(self.sntns_df[self.lang]["only"])
+            print(self.sntns["only"])
             pass
         species = list(map(lambda x: str(x) ,input(">> ").split()))
         return species
@@ -392,41 +438,27 @@ class Cui_input():
         """
         Select an option whether assign omit and only chemical species or not.
         """
-        while True:
-            if mode == "omit":
-                print(self.sntns_df[self.lang]["cont_omit"])
-            elif mode == "only":
-                print(self.sntns_df[self.lang]["cont_only"])
-            option = str(input(">> "))
-            if option == "y":
-                res = True
-                break
-            elif option == "n":
-                res = False
-                break
-            else:
-                print("Please re-confirm the input answer. Input \"y\" or \"n\"")
-        return res
+        return(self._ask_yn("cont_" + mode))    # "cont_omit" or "cont_only"
                 
     def _inp_eps_(self):
         """
         Input nozzle-area ratio
         """      
-        print(self.sntns_df[self.lang]["eps"])
+        print(self.sntns["eps"])
         self.eps = float(input(">> "))
         
     def _inp_of_(self):
         """
         Input calculation range of O/F
         """      
-        print(self.sntns_df[self.lang]["of"])
+        print(self.sntns["of"])
         self.of = list(map(lambda x: float(x) ,input(">> ").split()))
       
     def _inp_Pc_(self):
         """
         Input calculation range of chamber pressure, Pc.
         """      
-        print(self.sntns_df[self.lang]["Pc"])
+        print(self.sntns["Pc"])
         self.Pc = list(map(lambda x: float(x) ,input(">> ").split()))
 
     def _read_json_(self, fldpath):
@@ -506,34 +538,107 @@ class Cui_input():
             of: list, [start, end, interval], each element type is float  \n
             
         """
+        # imported here, so that importing make_inp() etc. from other scripts stays light
+        from tqdm import tqdm
+        from concurrent.futures import ProcessPoolExecutor
         path = os.path.join(self.fld_path, "inp")
-        of = np.arange(self.of[0], self.of[1], self.of[2])
-        Pc = np.arange(self.Pc[0], self.Pc[1], self.Pc[2])
+        of = _frange(*self.of)
+        Pc = _frange(*self.Pc)
         if len(self.list_other) != 0:
             wt_other = sum([dic["wt"] for dic in self.list_other])
-            num_round = int(2) #the number of decimal places in "Pc" & "of"
-            list_oxid = copy.deepcopy(self.list_oxid)
-            list_fuel = copy.deepcopy(self.list_fuel)
-
-        for i in tqdm(range(np.size(Pc))):
-            for j in range(np.size(of)):
-                if len(self.list_other) == 0:
-                    make_inp(path, self.option, of[j], Pc[i], self.list_oxid, self.list_fuel, self.eps, list_omit=self.omit, list_only=self.only)
-                else:
-                    Yo = (1.0-wt_other*1e-2)/(1 + 1/of[j])  # oxid mass fraction for all propellant mass
-                    Yf = (1.0-wt_other*1e-2)/(1 + of[j])    # fuel mass fraction for all propellant mass
-                    for k, dic in enumerate(self.list_oxid):
-                        list_oxid[k]["wt"] = round(dic["wt"]*Yo, 5)
-                    for k, dic in enumerate(self.list_fuel):
-                        list_fuel[k]["wt"] = round(dic["wt"]*Yf, 5)
-                    list_species = list_oxid + list_fuel + self.list_other
-                    fname = "Pc_{:0>5.2f}__of_{:0>5.2f}".format(round(Pc[i],num_round), round(of[j],num_round)) #.inp file name, e.g. "Pc=1.00_of=6.00"
-                    make_inp_name(path, self.option, list_species, Pc[i], self.eps, list_omit=self.omit, list_only=self.only, fname=fname)
+            # reactant list at each O/F, which does not depend on Pc; the original lists are not modified
+            wt_prop = 1.0 - wt_other*1e-2    # oxid and fuel mass fraction for all propellant mass
+            Yo = [wt_prop/(1 + 1/x) for x in of]    # oxid mass fraction for all propellant mass at each O/F
+            Yf = [wt_prop/(1 + x) for x in of]      # fuel mass fraction for all propellant mass at each O/F
+            list_species_of = []
+            for j in range(len(of)):
+                list_oxid = [dict(dic, wt=round(dic["wt"]*Yo[j], 5)) for dic in self.list_oxid]
+                list_fuel = [dict(dic, wt=round(dic["wt"]*Yf[j], 5)) for dic in self.list_fuel]
+                list_species_of.append(list_oxid + list_fuel + self.list_other)
+
+        # list of (function, args, kwargs), which is sent to worker processes
+        tasks = []
+        for i, j in product(range(len(Pc)), range(len(of))):
+            if len(self.list_other) == 0:
+                tasks.append((make_inp_text, (self.option, of[j], Pc[i], self.list_oxid, self.list_fuel, self.eps), {"list_omit": self.omit, "list_only": self.only}))
+            else:
+                fname = f"Pc_{Pc[i]:0>5.2f}__of_{of[j]:0>5.2f}" #.inp file name, e.g. "Pc=1.00_of=6.00"
+                tasks.append((make_inp_name_text, (self.option, list_species_of[j], Pc[i], self.eps), {"list_omit": self.omit, "list_only": self.only, "fname": fname}))
+        # workers only build the contents, and all files are written at once in this process
+        with ProcessPoolExecutor() as executor:
+            results = list(tqdm(executor.map(_worker, tasks, chunksize=64), total=len(tasks), desc="generating .inp"))
+        for inp_fname, lines in results:
+            _write_inp_(path, inp_fname, lines)
         self._make_json_(self.fld_path) # make condition file as json
         return(self.fld_path)
 
 
 
+def _frange(start, stop, step, num_round=2):
+    """
+    Return the list of values from "start" to "stop" (not included) at intervals of "step",
+    as same as numpy.arange() but without accumulating floating point error.
+    
+    Parameter
+    ---------
+    start, stop, step: float
+        range and interval
+    num_round: int, optional
+        the number of decimal places of each value
+    
+    Return
+    ------
+    values: list of float
+    """
+    num = max(0, math.ceil(round((stop - start)/step, 6)))  # round() drops the error of division, e.g. 9.600000000000001
+    return([round(start + k*step, num_round) for k in range(num)])
+
+
+def _worker(task):
+    """
+    Execute one task of gen_all() in a worker process.
+    
+    Parameter
+    ---------
+    task: tuple, (func, args, kwargs)
+        func: make_inp_text or make_inp_name_text
+
+    Return
+    ------
+    (inp_fname, lines): file name and lines of .inp file
+    """
+    func, args, kwargs = task
+    return(func(*args, **kwargs))
+
+
+def _react_line(ident, dic):
+    """
+    Return one line of "react" dataset in .inp file
+    
+    Parameter
+    ---------
+    ident: string
+        "oxid", "fuel" or "name"
+    dic: dict
+        dict{"name": name, "wt": weight fraction %, "temp": initial temperature K, "h": enthalpy kJ/mol, "elem": element}
+    """
+    if len(str(dic["h"]))==0:
+        return(f"\t{ident}={dic['name']} wt={dic['wt']} t,k={dic['temp']} \n")
+    return(f"\t{ident}={dic['name']} wt={dic['wt']} t,k={dic['temp']} h,kj/mol={dic['h']} {dic['elem']} \n")
+
+
+def _optional_lines(list_omit, list_only):
+    """
+    Return the lines of "omit" and "only" dataset in .inp file
+    """
+    optional = []
+    if len(list_omit) != 0:
+        optional.append("omit\n\t" + "".join([i + " " for i in list_omit]) + "\n")
+    if len(list_only) != 0:
+        optional.append("only\n\t" + "".join([i + " " for i in list_only]) + "\n")
+    return(optional)
+
+
 def make_inp(path, option, of, Pc, list_oxid, list_fuel, eps, list_omit=[], list_only=[], fname=False):
     """
     Write information in input file, "*.inp".
@@ -561,46 +666,34 @@ def make_inp(path, option, of, Pc, list_oxid, list_fuel, eps, list_omit=[], list
     fname: string, optional, default is False
         file name of generated .inp file
     """
-    if os.path.exists(path):
-        pass
-    else:
-        os.makedirs(path)
-    num_round = int(2) #the number of decimal places in "Pc" & "of"
+    _write_inp_(path, *make_inp_text(option, of, Pc, list_oxid, list_fuel, eps, list_omit=list_omit, list_only=list_only, fname=fname))
+
+
+def make_inp_text(option, of, Pc, list_oxid, list_fuel, eps, list_omit=[], list_only=[], fname=False):
+    """
+    Return the file name and the lines of input file, "*.inp", without writing it.
+    Parameters are the same as make_inp() except "path".
+
+    Return
+    ------
+    inp_fname: string
+        file name of .inp file
+    lines: list of string
+        contents of .inp file, which is written by file.writelines()
+    """
     if fname:
         inp_fname = fname + ".inp"
     else:
-        inp_fname = "Pc_{:0>5.2f}__of_{:0>5.2f}.inp".format(round(Pc,num_round), round(of,num_round)) #.inp file name, e.g. "Pc=1.00_of=6.00.inp"
-    file = open(os.path.join(path,inp_fname), "w")
-
-    Pc = Pc * 10    #Pc:Chamber pressure [bar]
-    prob = "case={} o/f={} rocket {} tcest,k=3800 p,bar={} sup,ae/at={}".format(inp_fname, round(of,4), option, round(Pc,4), round(eps,4))
-    oxid = ""
-    for i in range(len(list_oxid)):
-        if len(str(list_oxid[i]["h"]))==0:
-            oxid = oxid + "\toxid={} wt={} t,k={} \n".format(list_oxid[i]["name"], list_oxid[i]["wt"], list_oxid[i]["temp"])
-        else:
-            oxid = oxid + "\toxid={} wt={} t,k={} h,kj/mol={} {} \n".format(list_oxid[i]["name"], list_oxid[i]["wt"], list_oxid[i]["temp"], list_oxid[i]["h"], list_oxid[i]["elem"])
-    fuel = ""
-    for i in range(len(list_fuel)):
-        if len(str(list_fuel[i]["h"]))==0:
-            fuel = fuel + "\tfuel={} wt={} t,k={} \n".format(list_fuel[i]["name"], list_fuel[i]["wt"], list_fuel[i]["temp"])
-        else:
-            fuel = fuel + "\tfuel={} wt={} t,k={} h,kj/mol={} {} \n".format(list_fuel[i]["name"], list_fuel[i]["wt"], list_fuel[i]["temp"], list_fuel[i]["h"], list_fuel[i]["elem"])
-    optional = ""
-    if len(list_omit) != 0:
-        omit = "omit\n\t"
-        for i in list_omit:
-            omit += i + " "
-        optional += omit + "\n"
-    if len(list_only) != 0:
-        only = "only\n\t"
-        for i in list_only:
-            only += i + " "
-        optional += only + "\n"
+        inp_fname = f"Pc_{Pc:0>5.2f}__of_{of:0>5.2f}.inp" #.inp file name, e.g. "Pc=1.00_of=6.00.inp"
+
+    Pc_bar = Pc * 10    #Pc:Chamber pressure [bar]
+    prob = f"case={inp_fname} o/f={round(of,4)} rocket {option} tcest,k=3800 p,bar={round(Pc_bar,4)} sup,ae/at={round(eps,4)}"
+    oxid = [_react_line("oxid", dic) for dic in list_oxid]
+    fuel = [_react_line("fuel", dic) for dic in list_fuel]
+    optional = _optional_lines(list_omit, list_only)
 #    outp = "siunits short"
     outp = "transport"
-    file.write("prob\n\t{0}\nreact\n{1}{2}{3}output\t{4}\nend\n".format(prob,oxid,fuel,optional,outp))
-    file.close()
+    return(inp_fname, [f"prob\n\t{prob}\nreact\n", *oxid, *fuel, *optional, f"output\t{outp}\nend\n"])
 
 
 def make_inp_name(path, option, list_species, Pc, eps, list_omit=[], list_only=[], fname=False):
@@ -627,46 +720,56 @@ def make_inp_name(path, option, list_species, Pc, eps, list_omit=[], list_only=[
     fname: string, optional, default is False
         file name of generated .inp file
     """
+    _write_inp_(path, *make_inp_name_text(option, list_species, Pc, eps, list_omit=list_omit, list_only=list_only, fname=fname))
 
-    if os.path.exists(path):
-        pass
-    else:
-        os.makedirs(path)
-    num_round = int(2) #the number of decimal places in "Pc" & "of"
+
+def make_inp_name_text(option, list_species, Pc, eps, list_omit=[], list_only=[], fname=False):
+    """
+    Return the file name and the lines of input file, "*.inp", without writing it.
+    Parameters are the same as make_inp_name() except "path".
+
+    Return
+    ------
+    inp_fname: string
+        file name of .inp file
+    lines: list of string
+        contents of .inp file, which is written by file.writelines()
+    """
     if fname:
         inp_fname = fname + ".inp"
     else:
-        inp_fname = "Pc={:0>5.2f}_".format(round(Pc,num_round))
-        for dic in list_species:
-            inp_fname = inp_fname + "{}={:0>5.1f}".format(dic["name"], round(dic["wt"],num_round))   
-        inp_fname = inp_fname + ".inp"
-    file = open(os.path.join(path,inp_fname), "w")
-
-    Pc = Pc * 10    #Pc:Chamber pressure [bar]
-    prob = "case={} rocket {} tcest,k=3800 p,bar={} sup,ae/at={}".format(inp_fname, option, round(Pc,4), round(eps,4))
-    name = ""
-    for i in range(len(list_species)):
-        if len(str(list_species[i]["h"]))==0:
-            name = name + "\tname={} wt={} t,k={} \n".format(list_species[i]["name"], list_species[i]["wt"], list_species[i]["temp"])
-        else:
-            name = name + "\tname={} wt={} t,k={} h,kj/mol={} {} \n".format(list_species[i]["name"], list_species[i]["wt"], list_species[i]["temp"], list_species[i]["h"], list_species[i]["elem"])
-    optional = ""
-    if len(list_omit) != 0:
-        omit = "omit\n\t"
-        for i in list_omit:
-            omit += i + " "
-        optional += omit + "\n"
-    if len(list_only) != 0:
-        only = "only\n\t"
-        for i in list_only:
-            only += i + " "
-        optional += only + "\n"
+        species = "".join([f"{dic['name']}={dic['wt']:0>5.1f}" for dic in list_species])
+        inp_fname = f"Pc={Pc:0>5.2f}_{species}.inp"
+
+    Pc_bar = Pc * 10    #Pc:Chamber pressure [bar]
+    prob = f"case={inp_fname} rocket {option} tcest,k=3800 p,bar={round(Pc_bar,4)} sup,ae/at={round(eps,4)}"
+    name = [_react_line("name", dic) for dic in list_species]
+    optional = _optional_lines(list_omit, list_only)
 #    outp = "siunits short"
     outp = "transport"
-    file.write("prob\n\t{0}\nreact\n{1}{2}output\t{3}\nend\n".format(prob,name,optional,outp))
-    file.close()
+    return(inp_fname, [f"prob\n\t{prob}\nreact\n", *name, *optional, f"output\t{outp}\nend\n"])
+
+
+def _write_inp_(path, inp_fname, lines):
+    """
+    Write the lines of .inp file into the folder "path", which is made if it does not exist.
+    """
+    try:
+        file = open(os.path.join(path,inp_fname), "w", buffering=65536)
+    except FileNotFoundError:   # the folder is checked only when it is missing
+        os.makedirs(path, exist_ok=True)
+        file = open(os.path.join(path,inp_fname), "w", buffering=65536)
+    with file:
+        file.writelines(lines)
 
 
 if __name__ == "__main__":
-    myclass = Cui_input()
+    import argparse
+    parser = argparse.ArgumentParser(description="Generate NASA-CEA input files \"*.inp\"")
+    parser.add_argument("--cond", help="path of \"cond.json\"; .inp files are generated without CUI in the folder containing it")
+    args = parser.parse_args()
+    if args.cond is None:
+        myclass = Cui_input()
+    else:
+        myclass = Cui_input.from_json(os.path.dirname(os.path.abspath(args.cond)))
     myclass.gen_all()